@@ -833,6 +833,9 @@ def load_species_dictionary(path, generate_resonance_structures=True):
     species_dict = {}
 
     inerts = [Species().from_smiles(inert) for inert in ('[He]', '[Ne]', 'N#N', '[Ar]')]
+    # Matching fingerprints are necessary for isomorphism, so check them first to avoid
+    # looping over the inerts and resonance structures for most species
+    inert_fingerprints = {inert.fingerprint for inert in inerts}
     with open(path, 'r') as f:
         adjlist = ''
         for line in f:
@@ -842,10 +845,11 @@ def load_species_dictionary(path, generate_resonance_structures=True):
                 if generate_resonance_structures:
                     species.generate_resonance_structures()
                 label = species.label
-                for inert in inerts:
-                    if inert.is_isomorphic(species):
-                        species.reactive = False
-                        break
+                if species.fingerprint in inert_fingerprints:
+                    for inert in inerts:
+                        if inert.is_isomorphic(species):
+                            species.reactive = False
+                            break
                 species_dict[label] = species
                 adjlist = ''
             else:
@@ -861,10 +865,11 @@ def load_species_dictionary(path, generate_resonance_structures=True):
                 if generate_resonance_structures:
                     species.generate_resonance_structures()
                 label = species.label
-                for inert in inerts:
-                    if inert.is_isomorphic(species):
-                        species.reactive = False
-                        break
+                if species.fingerprint in inert_fingerprints:
+                    for inert in inerts:
+                        if inert.is_isomorphic(species):
+                            species.reactive = False
+                            break
                 species_dict[label] = species
 
     return species_dict
@@ -306,7 +306,8 @@ cdef class ReactionSystem(DASx):
         """
         cdef np.ndarray[np.int_t, ndim=2] product_indices, reactant_indices
         cdef list surface_species_indices, surface_reaction_indices, remove_inds
-        cdef set possible_species_indices
+        cdef set possible_species_indices, surface_species_index_set
+        cdef dict core_species_index, core_reaction_index
         cdef int i, j
         cdef bool not_in_surface
         cdef object obj
@@ -321,21 +322,28 @@ cdef class ReactionSystem(DASx):
         possible_species_indices = set()
         remove_inds = []
 
+        # Species and reactions compare by identity, so look up their indices by id
+        # instead of scanning the core lists for each surface object
+        core_species_index = {id(spc): ind for ind, spc in enumerate(core_species)}
+        core_reaction_index = {id(rxn): ind for ind, rxn in enumerate(core_reactions)}
+
         for obj in surface_species:
-            surface_species_indices.append(core_species.index(obj))
+            surface_species_indices.append(core_species_index[id(obj)])
 
         for obj in surface_reactions:
-            surface_reaction_indices.append(core_reactions.index(obj))
+            surface_reaction_indices.append(core_reaction_index[id(obj)])
+
+        surface_species_index_set = set(surface_species_indices)
 
         for i in surface_reaction_indices:  #remove surface reactions whose species have been moved to the bulk core
             not_in_surface = True
             for j in product_indices[i]:
                 possible_species_indices.add(j)
-                if j in surface_species_indices:
+                if j in surface_species_index_set:
                     not_in_surface = False
             for j in reactant_indices[i]:
                 possible_species_indices.add(j)
-                if j in surface_species_indices:
+                if j in surface_species_index_set:
                     not_in_surface = False
             if not_in_surface:
                 logging.info('removing disconnected reaction from surface: {0}'.format(str(core_reactions[i])))
@@ -504,40 +512,30 @@ cdef class ReactionSystem(DASx):
                     break
                 self.network_indices[j, k] = i
 
-    @cython.boundscheck(False)
     cpdef get_layering_indices(self):
         """
         determines the edge reaction indices that indicate reactions that are valid for movement from
         edge to surface based on the layering constraint
         """
 
-        cdef np.ndarray[np.int_t, ndim=1] surf_species_indices
-        cdef int i, j, k, index, num_core_species, num_core_reactions, num_edge_reactions
-        cdef list valid_indices
+        cdef np.ndarray valid
+        cdef object indices, outside_bulk_core
+        cdef int num_core_species, num_core_reactions, num_edge_reactions
 
-        surf_species_indices = self.surface_species_indices
         num_core_species = self.num_core_species
         num_core_reactions = self.num_core_reactions
         num_edge_reactions = self.num_edge_reactions
-        product_indices = self.product_indices
-        reactant_indices = self.reactant_indices
-
-        valid_indices = []
 
-        for index in range(num_edge_reactions):
-            for j in product_indices[index + num_core_reactions]:
-                if j in surf_species_indices or j >= num_core_species:
-                    break
-            else:
-                valid_indices.append(index)
-                continue
-            for j in reactant_indices[index + num_core_reactions]:
-                if j in surf_species_indices or j >= num_core_species:
-                    break
-            else:
-                valid_indices.append(index)
+        # an edge reaction is valid if all of its products or all of its reactants are in the bulk core,
+        # i.e. are neither surface nor edge species (the -1 entries for missing species always qualify)
+        valid = np.zeros(num_edge_reactions, bool)
+        for indices in (self.product_indices, self.reactant_indices):
+            indices = indices[num_core_reactions:num_core_reactions + num_edge_reactions]
+            outside_bulk_core = ((indices >= num_core_species) |
+                                 np.in1d(indices, self.surface_species_indices).reshape(indices.shape))
+            valid |= ~outside_bulk_core.any(axis=1)
 
-        return np.array(valid_indices)
+        return np.flatnonzero(valid)
 
     cpdef add_reactions_to_surface(self, list new_surface_reactions, list new_surface_reaction_inds, list surface_species,
                                    list surface_reactions, list edge_species):
@@ -31,31 +31,88 @@ import os.path
 import pickle
 import unittest
 
+import numpy as np
+
 import rmgpy
 from rmgpy.rmg.settings import ModelSettings, SimulatorSettings
+from rmgpy.solver.simple import SimpleReactor
 from rmgpy.tools.loader import load_rmg_py_job
 
+LISTENER_DIR = os.path.join(os.path.dirname(rmgpy.__file__), 'solver', 'files', 'listener')
+LISTENER_INPUT = os.path.join(LISTENER_DIR, 'input.py')
+LISTENER_CHEMKIN = os.path.join(LISTENER_DIR, 'chemkin', 'chem.inp')
+LISTENER_SPC_DICT = os.path.join(LISTENER_DIR, 'chemkin', 'species_dictionary.txt')
+
 
 class ConcentrationPrinter(object):
+    """
+    A reaction system listener that records the time and core species concentrations
+    each time it is notified. The data are stored in arrays that are sized on the
+    first update and grown geometrically as needed.
+    """
+
     def __init__(self):
         self.species_names = []
-        self.data = []
+        self._n = 0
+        self.t = np.empty(0, np.float64)
+        self.C = np.empty((0, 0), np.float64)
+
+    @property
+    def data(self):
+        """
+        The recorded ``(t, C)`` arrays, where ``C`` has shape ``(nsteps, nspecies)``.
+        """
+        return self.t[:self._n], self.C[:self._n]
 
     def update(self, subject):
-        self.data.append((subject.t, subject.core_species_concentrations))
+        concentrations = subject.core_species_concentrations
+        if self._n == 0:
+            self.t = np.empty(1, np.float64)
+            self.C = np.empty((1, concentrations.shape[0]), np.float64)
+        elif self._n == self.t.shape[0]:
+            self.t = np.resize(self.t, 2 * self._n)
+            self.C = np.resize(self.C, (2 * self._n, self.C.shape[1]))
+        self.t[self._n] = subject.t
+        np.copyto(self.C[self._n], concentrations)
+        self._n += 1
 
 
 class ReactionSystemTest(unittest.TestCase):
+    # The tests are independent since setUp rebuilds the reaction system, so the nose
+    # multiprocess plugin may split them across processes, each loading the RMG job once
+    _multiprocess_can_split_ = True
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        A method that is run ONCE before all unit tests in this class.
+
+        Loading the RMG job requires parsing the input file, chemkin file and species
+        dictionary, so it is done once here and shared between the tests.
+        """
+        cls.rmg = load_rmg_py_job(LISTENER_INPUT, LISTENER_CHEMKIN, LISTENER_SPC_DICT,
+                                  generate_images=False, check_duplicates=False)
+        cls.reaction_system = cls.rmg.reaction_systems[0]
 
     def setUp(self):
+        """
+        Give each test a freshly constructed reaction system, since the tests
+        attach listeners to it and initialize it with different models.
+        """
         self.listener = ConcentrationPrinter()
 
-        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'solver/files/listener/')
-        input_file = os.path.join(folder, 'input.py')
-        chemkin_file = os.path.join(folder, 'chemkin/chem.inp')
-        spc_dict = os.path.join(folder, 'chemkin/species_dictionary.txt')
-
-        self.rmg = load_rmg_py_job(input_file, chemkin_file, spc_dict, generate_images=False, check_duplicates=False)
+        # Construct the reactor from the loaded settings rather than pickling it, so that
+        # the initial mole fractions stay keyed by the loaded core species
+        rxn_sys = self.reaction_system
+        self.rmg.reaction_systems[0] = SimpleReactor(
+            rxn_sys.T, rxn_sys.P, rxn_sys.initial_mole_fractions,
+            n_sims=rxn_sys.n_sims,
+            termination=rxn_sys.termination,
+            sensitive_species=rxn_sys.sensitive_species,
+            sensitivity_threshold=rxn_sys.sensitivity_threshold,
+            sens_conditions=rxn_sys.sens_conditions,
+            const_spc_names=rxn_sys.const_spc_names,
+        )
 
     def test_surface_initialization(self):
         """
@@ -131,13 +188,17 @@ class ReactionSystemTest(unittest.TestCase):
                                          edge_species, edge_reactions, surface_species, surface_reactions)
 
         new_surface_reactions = edge_reactions
-        new_surface_reaction_inds = [edge_reactions.index(i) for i in new_surface_reactions]
+        edge_reaction_index = {id(rxn): i for i, rxn in enumerate(edge_reactions)}
+        new_surface_reaction_inds = [edge_reaction_index[id(rxn)] for rxn in new_surface_reactions]
 
         surface_species, surface_reactions = reaction_system.add_reactions_to_surface(
             new_surface_reactions, new_surface_reaction_inds, surface_species, surface_reactions, edge_species)
 
-        self.assertEqual(set(surface_species), set(edge_species))  # all edge species should now be in the surface
-        self.assertEqual(set(surface_reactions), set(edge_reactions))  # all edge reactions should now be in the surface
+        # compare by identity to avoid hashing species and reactions
+        # all edge species should now be in the surface
+        self.assertEqual({id(spc) for spc in surface_species}, {id(spc) for spc in edge_species})
+        # all edge reactions should now be in the surface
+        self.assertEqual({id(rxn) for rxn in surface_reactions}, {id(rxn) for rxn in edge_reactions})
 
     def test_attach_detach(self):
         """
@@ -162,7 +223,7 @@ class ReactionSystemTest(unittest.TestCase):
 
         reaction_model = self.rmg.reaction_model
 
-        self.assertEqual(self.listener.data, [])
+        self.assertEqual(len(self.listener.data[0]), 0)
 
         model_settings = ModelSettings(tol_move_to_core=1, tol_keep_in_edge=0, tol_interrupt_simulation=1)
         simulator_settings = SimulatorSettings()
@@ -179,14 +240,19 @@ class ReactionSystemTest(unittest.TestCase):
             simulator_settings=simulator_settings,
         )
 
-        self.assertNotEqual(self.listener.data, [])
+        t, concentrations = self.listener.data
+        self.assertNotEqual(len(t), 0)
+        # the listener should store a copy of the concentrations, not a reference to the reactor's array
+        self.assertFalse(np.shares_memory(concentrations, reaction_system.core_species_concentrations))
+        self.assertTrue(np.array_equal(concentrations[-1], reaction_system.core_species_concentrations))
 
     def test_pickle(self):
         """
         Test that a ReactionSystem object can be un/pickled.
         """
         rxn_sys1 = self.rmg.reaction_systems[0]
-        rxn_sys = pickle.loads(pickle.dumps(rxn_sys1))
+        pickled = pickle.dumps(rxn_sys1)
+        rxn_sys = pickle.loads(pickled)
 
         self.assertIsNotNone(rxn_sys)
         self.assertTrue(isinstance(rxn_sys, rmgpy.solver.simple.SimpleReactor))
@@ -195,6 +261,12 @@ class ReactionSystemTest(unittest.TestCase):
         self.assertEqual(rxn_sys.termination[0].conversion, rxn_sys1.termination[0].conversion)
         self.assertEqual(rxn_sys.termination[1].time.value_si, rxn_sys1.termination[1].time.value_si)
 
+        # the kinetic model arrays built by initialize_model should not be pickled
+        reaction_model = self.rmg.reaction_model
+        rxn_sys1.initialize_model(reaction_model.core.species, reaction_model.core.reactions,
+                                  reaction_model.edge.species, reaction_model.edge.reactions)
+        self.assertEqual(len(pickle.dumps(rxn_sys1)), len(pickled))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -570,9 +570,9 @@ cdef class SimpleReactor(ReactionSystem):
         Return the analytical Jacobian for the reaction system.
         """
         cdef np.ndarray[np.int_t, ndim=2] ir, ip
-        cdef np.ndarray[np.float64_t, ndim=1] kf, kr, C
+        cdef np.ndarray[np.float64_t, ndim=1] kf, kr, C, row_corr
         cdef np.ndarray[np.float64_t, ndim=2] pd
-        cdef int num_core_reactions, num_core_species, i, j
+        cdef int num_core_reactions, num_core_species, j
         cdef double k, V, Ctot, deriv, corr
 
         ir = self.reactant_indices
@@ -584,6 +584,9 @@ cdef class SimpleReactor(ReactionSystem):
         num_core_species = len(self.core_species_concentrations)
 
         pd = -cj * np.identity(num_core_species, np.float64)
+        # The volume corrections are the same for every column of a row, so they are
+        # accumulated per row and added to pd once after looping over the reactions
+        row_corr = np.zeros(num_core_species, np.float64)
 
         V = constants.R * self.T.value_si * np.sum(y[:num_core_species]) / self.P.value_si
 
@@ -612,20 +615,16 @@ cdef class SimpleReactor(ReactionSystem):
                 if ir[j, 0] == ir[j, 1]:  # reactants are the same
                     deriv = 2 * k * C[ir[j, 0]]
                     pd[ir[j, 0], ir[j, 0]] -= 2 * deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= 2 * corr
+                    row_corr[ir[j, 0]] -= 2 * corr
 
                     pd[ip[j, 0], ir[j, 0]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
+                    row_corr[ip[j, 0]] += corr
                     if ip[j, 1] != -1:
                         pd[ip[j, 1], ir[j, 0]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
+                        row_corr[ip[j, 1]] += corr
                         if ip[j, 2] != -1:
                             pd[ip[j, 2], ir[j, 0]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
+                            row_corr[ip[j, 2]] += corr
 
                 else:
                     # Derivative with respect to reactant 1
@@ -643,21 +642,17 @@ cdef class SimpleReactor(ReactionSystem):
                     deriv = k * C[ir[j, 0]]
                     pd[ir[j, 0], ir[j, 1]] -= deriv
                     pd[ir[j, 1], ir[j, 1]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= corr
-                        pd[ir[j, 1], i] -= corr
+                    row_corr[ir[j, 0]] -= corr
+                    row_corr[ir[j, 1]] -= corr
 
                     pd[ip[j, 0], ir[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
+                    row_corr[ip[j, 0]] += corr
                     if ip[j, 1] != -1:
                         pd[ip[j, 1], ir[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
+                        row_corr[ip[j, 1]] += corr
                         if ip[j, 2] != -1:
                             pd[ip[j, 2], ir[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
+                            row_corr[ip[j, 2]] += corr
 
 
             else:  # three reactants
@@ -665,20 +660,16 @@ cdef class SimpleReactor(ReactionSystem):
                 if (ir[j, 0] == ir[j, 1] & ir[j, 0] == ir[j, 2]):
                     deriv = 3 * k * C[ir[j, 0]] * C[ir[j, 0]]
                     pd[ir[j, 0], ir[j, 0]] -= 3 * deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= 3 * corr
+                    row_corr[ir[j, 0]] -= 3 * corr
 
                     pd[ip[j, 0], ir[j, 0]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
+                    row_corr[ip[j, 0]] += corr
                     if ip[j, 1] != -1:
                         pd[ip[j, 1], ir[j, 0]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
+                        row_corr[ip[j, 1]] += corr
                         if ip[j, 2] != -1:
                             pd[ip[j, 2], ir[j, 0]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
+                            row_corr[ip[j, 2]] += corr
 
                 elif ir[j, 0] == ir[j, 1]:
                     # derivative with respect to reactant 1
@@ -696,21 +687,17 @@ cdef class SimpleReactor(ReactionSystem):
                     deriv = k * C[ir[j, 0]] * C[ir[j, 0]]
                     pd[ir[j, 0], ir[j, 2]] -= 2 * deriv
                     pd[ir[j, 2], ir[j, 2]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= 2 * corr
-                        pd[ir[j, 2], i] -= corr
+                    row_corr[ir[j, 0]] -= 2 * corr
+                    row_corr[ir[j, 2]] -= corr
 
                     pd[ip[j, 0], ir[j, 2]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
+                    row_corr[ip[j, 0]] += corr
                     if ip[j, 1] != -1:
                         pd[ip[j, 1], ir[j, 2]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
+                        row_corr[ip[j, 1]] += corr
                         if ip[j, 2] != -1:
                             pd[ip[j, 2], ir[j, 2]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
+                            row_corr[ip[j, 2]] += corr
 
 
                 elif ir[j, 1] == ir[j, 2]:
@@ -728,21 +715,17 @@ cdef class SimpleReactor(ReactionSystem):
                     deriv = 2 * k * C[ir[j, 0]] * C[ir[j, 1]]
                     pd[ir[j, 0], ir[j, 1]] -= deriv
                     pd[ir[j, 1], ir[j, 1]] -= 2 * deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= corr
-                        pd[ir[j, 1], i] -= 2 * corr
+                    row_corr[ir[j, 0]] -= corr
+                    row_corr[ir[j, 1]] -= 2 * corr
 
                     pd[ip[j, 0], ir[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
+                    row_corr[ip[j, 0]] += corr
                     if ip[j, 1] != -1:
                         pd[ip[j, 1], ir[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
+                        row_corr[ip[j, 1]] += corr
                         if ip[j, 2] != -1:
                             pd[ip[j, 2], ir[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
+                            row_corr[ip[j, 2]] += corr
 
                 elif ir[j, 0] == ir[j, 2]:
                     # derivative with respect to reactant 1
@@ -759,21 +742,17 @@ cdef class SimpleReactor(ReactionSystem):
                     deriv = k * C[ir[j, 0]] * C[ir[j, 0]]
                     pd[ir[j, 0], ir[j, 1]] -= 2 * deriv
                     pd[ir[j, 1], ir[j, 1]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= 2 * corr
-                        pd[ir[j, 1], i] -= corr
+                    row_corr[ir[j, 0]] -= 2 * corr
+                    row_corr[ir[j, 1]] -= corr
 
                     pd[ip[j, 0], ir[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
+                    row_corr[ip[j, 0]] += corr
                     if ip[j, 1] != -1:
                         pd[ip[j, 1], ir[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
+                        row_corr[ip[j, 1]] += corr
                         if ip[j, 2] != -1:
                             pd[ip[j, 2], ir[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
+                            row_corr[ip[j, 2]] += corr
 
                 else:
                     # derivative with respect to reactant 1
@@ -805,22 +784,18 @@ cdef class SimpleReactor(ReactionSystem):
                     pd[ir[j, 0], ir[j, 2]] -= deriv
                     pd[ir[j, 1], ir[j, 2]] -= deriv
                     pd[ir[j, 2], ir[j, 2]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= corr
-                        pd[ir[j, 1], i] -= corr
-                        pd[ir[j, 2], i] -= corr
+                    row_corr[ir[j, 0]] -= corr
+                    row_corr[ir[j, 1]] -= corr
+                    row_corr[ir[j, 2]] -= corr
 
                     pd[ip[j, 0], ir[j, 2]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
+                    row_corr[ip[j, 0]] += corr
                     if ip[j, 1] != -1:
                         pd[ip[j, 1], ir[j, 2]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
+                        row_corr[ip[j, 1]] += corr
                         if ip[j, 2] != -1:
                             pd[ip[j, 2], ir[j, 2]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
+                            row_corr[ip[j, 2]] += corr
 
             k = kr[j]
             if ip[j, 1] == -1:  # only one reactant
@@ -839,20 +814,16 @@ cdef class SimpleReactor(ReactionSystem):
                 if ip[j, 0] == ip[j, 1]:
                     deriv = 2 * k * C[ip[j, 0]]
                     pd[ip[j, 0], ip[j, 0]] -= 2 * deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= 2 * corr
+                    row_corr[ip[j, 0]] -= 2 * corr
 
                     pd[ir[j, 0], ip[j, 0]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
+                    row_corr[ir[j, 0]] += corr
                     if ir[j, 1] != -1:
                         pd[ir[j, 1], ip[j, 0]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
+                        row_corr[ir[j, 1]] += corr
                         if ir[j, 2] != -1:
                             pd[ir[j, 2], ip[j, 0]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
+                            row_corr[ir[j, 2]] += corr
 
                 else:
                     # Derivative with respect to reactant 1
@@ -870,21 +841,17 @@ cdef class SimpleReactor(ReactionSystem):
                     deriv = k * C[ip[j, 0]]
                     pd[ip[j, 0], ip[j, 1]] -= deriv
                     pd[ip[j, 1], ip[j, 1]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= corr
-                        pd[ip[j, 1], i] -= corr
+                    row_corr[ip[j, 0]] -= corr
+                    row_corr[ip[j, 1]] -= corr
 
                     pd[ir[j, 0], ip[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
+                    row_corr[ir[j, 0]] += corr
                     if ir[j, 1] != -1:
                         pd[ir[j, 1], ip[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
+                        row_corr[ir[j, 1]] += corr
                         if ir[j, 2] != -1:
                             pd[ir[j, 2], ip[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
+                            row_corr[ir[j, 2]] += corr
 
 
             else:  # three reactants
@@ -892,20 +859,16 @@ cdef class SimpleReactor(ReactionSystem):
                 if (ip[j, 0] == ip[j, 1] & ip[j, 0] == ip[j, 2]):
                     deriv = 3 * k * C[ip[j, 0]] * C[ip[j, 0]]
                     pd[ip[j, 0], ip[j, 0]] -= 3 * deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= 3 * corr
+                    row_corr[ip[j, 0]] -= 3 * corr
 
                     pd[ir[j, 0], ip[j, 0]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
+                    row_corr[ir[j, 0]] += corr
                     if ir[j, 1] != -1:
                         pd[ir[j, 1], ip[j, 0]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
+                        row_corr[ir[j, 1]] += corr
                         if ir[j, 2] != -1:
                             pd[ir[j, 2], ip[j, 0]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
+                            row_corr[ir[j, 2]] += corr
 
                 elif ip[j, 0] == ip[j, 1]:
                     # derivative with respect to reactant 1
@@ -922,21 +885,17 @@ cdef class SimpleReactor(ReactionSystem):
                     deriv = k * C[ip[j, 0]] * C[ip[j, 0]]
                     pd[ip[j, 0], ip[j, 2]] -= 2 * deriv
                     pd[ip[j, 2], ip[j, 2]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= 2 * corr
-                        pd[ip[j, 2], i] -= corr
+                    row_corr[ip[j, 0]] -= 2 * corr
+                    row_corr[ip[j, 2]] -= corr
 
                     pd[ir[j, 0], ip[j, 2]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
+                    row_corr[ir[j, 0]] += corr
                     if ir[j, 1] != -1:
                         pd[ir[j, 1], ip[j, 2]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
+                        row_corr[ir[j, 1]] += corr
                         if ir[j, 2] != -1:
                             pd[ir[j, 2], ip[j, 2]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
+                            row_corr[ir[j, 2]] += corr
 
 
                 elif ip[j, 1] == ip[j, 2]:
@@ -955,21 +914,17 @@ cdef class SimpleReactor(ReactionSystem):
                     deriv = 2 * k * C[ip[j, 0]] * C[ip[j, 1]]
                     pd[ip[j, 0], ip[j, 1]] -= deriv
                     pd[ip[j, 1], ip[j, 1]] -= 2 * deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= corr
-                        pd[ip[j, 1], i] -= 2 * corr
+                    row_corr[ip[j, 0]] -= corr
+                    row_corr[ip[j, 1]] -= 2 * corr
 
                     pd[ir[j, 0], ip[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
+                    row_corr[ir[j, 0]] += corr
                     if ir[j, 1] != -1:
                         pd[ir[j, 1], ip[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
+                        row_corr[ir[j, 1]] += corr
                         if ir[j, 2] != -1:
                             pd[ir[j, 2], ip[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
+                            row_corr[ir[j, 2]] += corr
 
                 elif ip[j, 0] == ip[j, 2]:
                     # derivative with respect to reactant 1
@@ -986,21 +941,17 @@ cdef class SimpleReactor(ReactionSystem):
                     deriv = k * C[ip[j, 0]] * C[ip[j, 0]]
                     pd[ip[j, 0], ip[j, 1]] -= 2 * deriv
                     pd[ip[j, 1], ip[j, 1]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= 2 * corr
-                        pd[ip[j, 1], i] -= corr
+                    row_corr[ip[j, 0]] -= 2 * corr
+                    row_corr[ip[j, 1]] -= corr
 
                     pd[ir[j, 0], ip[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
+                    row_corr[ir[j, 0]] += corr
                     if ir[j, 1] != -1:
                         pd[ir[j, 1], ip[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
+                        row_corr[ir[j, 1]] += corr
                         if ir[j, 2] != -1:
                             pd[ir[j, 2], ip[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
+                            row_corr[ir[j, 2]] += corr
 
                 else:
                     # derivative with respect to reactant 1
@@ -1032,22 +983,20 @@ cdef class SimpleReactor(ReactionSystem):
                     pd[ip[j, 0], ip[j, 2]] -= deriv
                     pd[ip[j, 1], ip[j, 2]] -= deriv
                     pd[ip[j, 2], ip[j, 2]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= corr
-                        pd[ip[j, 1], i] -= corr
-                        pd[ip[j, 2], i] -= corr
+                    row_corr[ip[j, 0]] -= corr
+                    row_corr[ip[j, 1]] -= corr
+                    row_corr[ip[j, 2]] -= corr
 
                     pd[ir[j, 0], ip[j, 2]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
+                    row_corr[ir[j, 0]] += corr
                     if ir[j, 1] != -1:
                         pd[ir[j, 1], ip[j, 2]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
+                        row_corr[ir[j, 1]] += corr
                         if ir[j, 2] != -1:
                             pd[ir[j, 2], ip[j, 2]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
+                            row_corr[ir[j, 2]] += corr
+
+        pd += row_corr[:, np.newaxis]
 
         self.jacobian_matrix = pd + cj * np.identity(num_core_species, np.float64)
         return pd